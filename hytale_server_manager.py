@@ -5,48 +5,130 @@ import time
 import datetime
 import shutil
 import urllib.request
+import urllib.error
+import http.client
 import zipfile
+import io
 import threading
 import queue
 import platform
 import re
 import signal
+import errno
+import stat
 import json
+import copy
 import traceback
+import atexit
 import webbrowser
+import zlib
+import hashlib
+import base64
+import selectors
+import itertools
+import urllib.parse
+import collections
+import functools
+import importlib.util
+import concurrent.futures
 import version
 
 JAVA_VERSION_REQ = 25
+JAVA_CHECK_TIMEOUT = 5
 SERVER_JAR = "HytaleServer.jar"
 UPDATER_ZIP_URL = "https://downloader.hytale.com/hytale-downloader.zip"
 UPDATER_ZIP_FILE = "hytale-downloader.zip"
+SELF_UPDATE_HOST = "raw.githubusercontent.com"
+SELF_UPDATE_PATH = "/UnDadFeated/Hytale_Server_Manager/master"
 IS_WINDOWS = platform.system() == "Windows"
+IS_DARWIN = platform.system() == "Darwin"
 UPDATER_EXECUTABLE = "hytale-downloader.exe" if IS_WINDOWS else "hytale-downloader"
+# Standard and platform specific updater names, resolved once at import
+UPDATER_CANDIDATES = (UPDATER_EXECUTABLE, "hytale-downloader-windows-amd64.exe" if IS_WINDOWS else "hytale-downloader-linux-amd64")
+UPDATER_JAR_CMD = ("java", "-jar", "hytale-downloader.jar")
 ASSETS_FILE = "Assets.zip"
 AOT_FILE = "HytaleServer.aot"
 LOG_FILE = "hytale_server_manager.log"
 CONFIG_FILE = "hytale_server_manager_config.json"
 BACKUP_DIR = "universe/backups"
 WORLD_DIR = "universe/worlds"
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+UPDATER_MEMORY_LIMIT = 64 * 1024 * 1024
+BACKUP_READ_CHUNK = 1024 * 1024
+BACKUP_COMPRESS_LEVEL = 1
+# Files above this are streamed by the zip writer itself instead of being compressed in RAM
+BACKUP_INMEMORY_LIMIT = 32 * 1024 * 1024
+BACKUP_STORED_EXTENSIONS = {".zip", ".gz", ".zst", ".xz", ".bz2", ".7z", ".png", ".jpg", ".jpeg", ".mca", ".mcc"}
+EXTRACT_CHUNK_SIZE = 1024 * 1024
+EXTRACT_SERIAL_LIMIT = 64 * 1024
+SERVER_PIPE_SIZE = 1024 * 1024
+STREAM_READ_SIZE = 64 * 1024
+WEBHOOK_BATCH_DELAY = 2
+LOG_FILE_BUFFER = 128 * 1024
+LOG_FLUSH_INTERVAL_MS = 2000
+CONSOLE_KEEP_LINES = 1000
+CONSOLE_MAX_LINES = 1200
+CONSOLE_TRIM_CHECK_LINES = 20
+LOG_QUEUE_MAX = 5000
+LOG_BATCH_MAX = 500
+SAVE_DEBOUNCE_MS = 500
+
+# Matches 'version "25.0.1"' as well as the legacy 'version "1.8.0"' style
+JAVA_VERSION_RE = re.compile(rb'version\s+"(?:1\.)?(\d+)')
+MEMORY_RE = re.compile(r"^\d+[GM]$")
+# Any extracted updater build: plain binary, .exe or .jar
+UPDATER_NAME_RE = re.compile(r"hytale-downloader[\w-]*(\.jar|\.exe)?")
+ANSI_STRIP_RE = re.compile(r'\x1b\[[0-9;]*m')
+ANSI_COLOR_TAGS = {
+    "31": "red", "91": "red",
+    "32": "green", "92": "green",
+    "33": "yellow", "93": "yellow",
+    "36": "cyan", "96": "cyan",
+}
+
+# Optional dependencies are loaded on first use rather than at import, so -help (and
+# runs that never need them) skip loading them and their shared libraries
+
+@functools.lru_cache(maxsize=None)
+def rich_console():
+    """Returns a rich Console, or None without rich."""
+    try:
+        from rich.console import Console
+        return Console()
+    except ImportError:
+        return None
 
-try:
-    from rich.console import Console
-    console = Console()
-except ImportError:
-    console = None
+@functools.lru_cache(maxsize=None)
+def load_psutil():
+    """Returns the psutil module, or None without it."""
+    try:
+        import psutil
+        return psutil
+    except ImportError:
+        return None
 
-try:
-    import discord
-    from discord.ext import commands
-    HAS_DISCORD = True
-except ImportError:
-    HAS_DISCORD = False
+@functools.lru_cache(maxsize=None)
+def load_libarchive():
+    """Returns python-libarchive-c, or None if it (or its shared library) isn't usable."""
+    try:
+        import libarchive
+    except Exception:
+        # python-libarchive-c missing, or present without the libarchive shared library
+        # (that surfaces as OSError, AttributeError or TypeError depending on the platform)
+        return None
+    # The unrelated "libarchive" package on PyPI has a different API
+    return libarchive if hasattr(libarchive, "extract_file") else None
+
+# Only look for Tk and discord.py here; importing them (loading Tcl, discord's
+# aiohttp stack) is left to the code that uses them
+HAS_TK = importlib.util.find_spec("_tkinter") is not None
+HAS_DISCORD = importlib.util.find_spec("discord") is not None
 
 def validate_config(config):
     """Validates the configuration values."""
     # Memory check (e.g., 4G, 4096M)
     mem = config.get("server_memory", "4G")
-    if not re.match(r"^\d+[GM]$", mem):
+    if not MEMORY_RE.match(mem):
         print(f"WARNING: Invalid server_memory format '{mem}'. Reverting to 4G.")
         config["server_memory"] = "4G"
 
@@ -59,8 +141,17 @@ def validate_config(config):
 
     return config
 
+_config_cache = None
+# Saves come from the Tk thread's background pool and from core threads
+_config_lock = threading.Lock()
+
 def load_config():
-    """Loads the server configuration from the JSON file."""
+    """Loads the server configuration from the JSON file (parsed once, then cached)."""
+    global _config_cache
+    if _config_cache is not None:
+        # Hand out a copy so callers mutating it don't poison the cache
+        return copy.deepcopy(_config_cache)
+
     default_config = {
         "last_server_version": "0.0.0",
         "dark_mode": True,
@@ -77,7 +168,13 @@ def load_config():
         "restart_interval": 12,
         "server_memory": "8G",
         "max_backups": 3,
-        "manager_auto_update": True
+        "manager_auto_update": True,
+        "updater_etag": "",
+        "updater_last_modified": "",
+        "last_world_fingerprint": "",
+        "last_world_backup": "",
+        "java_check": {},
+        "installed_fingerprint": None
     }
     if os.path.exists(CONFIG_FILE):
         try:
@@ -87,15 +184,484 @@ def load_config():
         except Exception as e:
             print(f"Error loading config: {e}")
     
-    return validate_config(default_config)
+    _config_cache = validate_config(default_config)
+    return copy.deepcopy(_config_cache)
 
 def save_config(config):
     """Saves the current configuration to the JSON file."""
+    global _config_cache
+    with _config_lock:
+        # Nothing changed since the last load/save: skip the write and fsync
+        if config == _config_cache and os.path.exists(CONFIG_FILE):
+            return
+        tmp_file = CONFIG_FILE + ".tmp"
+        try:
+            # Write a temp file and rename it over the config so a crash can't truncate it
+            with open(tmp_file, "w") as f:
+                json.dump(config, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, CONFIG_FILE)
+            # Deep copy: nested values (java_check, installed_fingerprint) must not
+            # alias the caller's dict or the no-change check above would miss edits
+            _config_cache = copy.deepcopy(config)
+        except Exception as e:
+            print(f"Error saving config: {e}")
+
+def strip_ansi(text):
+    """Removes ANSI color codes; lines without an ESC byte skip the regex entirely."""
+    if '\x1b' not in text: return text
+    return ANSI_STRIP_RE.sub('', text)
+
+@functools.lru_cache(maxsize=8)
+def build_server_cmd(memory, assets_path, use_aot):
+    """Returns the JVM argv for launching the server; restarts with the same settings reuse it."""
+    cmd = ["java", f"-Xmx{memory}"]
+    if use_aot: cmd.append(f"-XX:AOTCache={AOT_FILE}")
+    cmd.extend(["-jar", SERVER_JAR, "--assets", assets_path])
+    return tuple(cmd)
+
+_timestamp_cache = {}
+
+def log_timestamp(fmt):
+    """Formats the current time with fmt; lines logged within the same second share one string."""
+    sec = int(time.time())
+    cached = _timestamp_cache.get(fmt)
+    if cached and cached[0] == sec: return cached[1]
+    text = time.strftime(fmt, time.localtime(sec))
+    _timestamp_cache[fmt] = (sec, text)
+    return text
+
+def win32_java_processes():
+    """Yields (pid, command line) for every java.exe/javaw.exe process using the Win32 API."""
+    import ctypes
+    from ctypes import wintypes
+
+    TH32CS_SNAPPROCESS = 0x00000002
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    PROCESS_COMMAND_LINE_INFORMATION = 60  # Windows 8.1+
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD), ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD), ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD), ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD), ("pcPriClassBase", ctypes.c_long),
+            ("dwFlags", wintypes.DWORD), ("szExeFile", wintypes.WCHAR * 260),
+        ]
+
+    class UNICODE_STRING(ctypes.Structure):
+        _fields_ = [("Length", wintypes.USHORT), ("MaximumLength", wintypes.USHORT), ("Buffer", ctypes.c_void_p)]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    ntdll = ctypes.WinDLL("ntdll")
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    ntdll.NtQueryInformationProcess.restype = ctypes.c_long
+    ntdll.NtQueryInformationProcess.argtypes = [wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.ULONG, ctypes.POINTER(wintypes.ULONG)]
+
+    def command_line(pid):
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle: return ""
+        try:
+            size = wintypes.ULONG(0)
+            # First call only reports the buffer size needed
+            ntdll.NtQueryInformationProcess(handle, PROCESS_COMMAND_LINE_INFORMATION, None, 0, ctypes.byref(size))
+            if not size.value: return ""
+            buf = ctypes.create_string_buffer(size.value)
+            if ntdll.NtQueryInformationProcess(handle, PROCESS_COMMAND_LINE_INFORMATION, buf, size, ctypes.byref(size)) != 0:
+                return ""
+            us = UNICODE_STRING.from_buffer(buf)
+            return ctypes.wstring_at(us.Buffer, us.Length // 2) if us.Buffer else ""
+        finally:
+            kernel32.CloseHandle(handle)
+
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        ok = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            if entry.szExeFile.lower() in ("java.exe", "javaw.exe"):
+                yield entry.th32ProcessID, command_line(entry.th32ProcessID)
+            ok = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+
+@functools.lru_cache(maxsize=None)
+def parse_version(v):
+    """Parses a plain dotted version ("3.2.8") into an int tuple, or None if it isn't one."""
+    try:
+        return tuple(int(x) for x in v.split('.'))
+    except ValueError:
+        return None
+
+def is_newer_version(remote, local):
+    """Returns True if version string remote is newer than local."""
+    remote_t, local_t = parse_version(remote), parse_version(local)
+    if remote_t is not None and local_t is not None:
+        return remote_t > local_t
+
+    # Pre-releases etc. ("3.3.0rc1") need proper PEP 440 ordering
+    try:
+        from packaging.version import Version
+        return Version(remote) > Version(local)
+    except Exception:
+        # No packaging available: compare the numeric release part only
+        def release(v):
+            m = re.match(r"\d+(?:\.\d+)*", v.strip().lstrip("v"))
+            return parse_version(m.group(0)) if m else ()
+        return release(remote) > release(local)
+
+def run_in_thread(fn, *args):
+    """Runs fn on a daemon thread and returns a Future for its result.
+
+    Startup work uses this rather than a pool: pool workers are joined at exit,
+    so closing the manager mid-download or mid-backup would wait for it to finish.
+    """
+    future = concurrent.futures.Future()
+    def run():
+        if not future.set_running_or_notify_cancel(): return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+def https_connection(host, timeout=15):
+    """Opens an HTTPSConnection to host, tunnelling through HTTPS_PROXY when one applies (as urllib would)."""
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(host.split(":")[0]):
+        return http.client.HTTPSConnection(host, timeout=timeout)
+    parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    headers = {}
+    if parts.username:
+        creds = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode("utf-8")).decode("ascii")
+    conn = http.client.HTTPSConnection(parts.hostname, parts.port or (443 if parts.scheme == "https" else 80), timeout=timeout)
+    conn.set_tunnel(host, headers=headers)
+    return conn
+
+def file_size(path):
+    """Returns the size of path, or None if it doesn't exist (one stat instead of exists + getsize)."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+def ensure_dir(path):
+    """Creates a directory; when it (or its parent) already exists this is a single mkdir."""
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+
+@functools.lru_cache(maxsize=None)
+def folder_opener():
+    """Returns the desktop's folder opener, as an absolute path once it has been found on PATH."""
+    name = "open" if IS_DARWIN else "xdg-open"
+    return shutil.which(name) or name
+
+def fast_copy(src, dst):
+    """Copies a file in-kernel (copy_file_range/sendfile) where available, keeping its metadata."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        try:
+            if hasattr(os, "copy_file_range"):
+                while remaining > 0:
+                    sent = os.copy_file_range(in_fd, out_fd, remaining)
+                    if sent == 0: break
+                    remaining -= sent
+            else:
+                offset = 0
+                while remaining > 0:
+                    sent = os.sendfile(out_fd, in_fd, offset, remaining)
+                    if sent == 0: break
+                    offset += sent
+                    remaining -= sent
+        except (AttributeError, OSError):
+            # Not supported here (e.g. Windows or an odd filesystem), copy in userspace
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, length=BACKUP_READ_CHUNK)
+    shutil.copystat(src, dst)
+    return dst
+
+def _deflate_file(path, level=BACKUP_COMPRESS_LEVEL):
+    """Compresses a file for the backup zip. Returns (data, crc, size, compress_type)."""
+    # Already-compressed formats gain nothing from deflate, so store them as-is
+    store = os.path.splitext(path)[1].lower() in BACKUP_STORED_EXTENSIONS
+    compressor = None if store else zlib.compressobj(level, zlib.DEFLATED, -15)
+    chunks = []
+    crc = 0
+    size = 0
+    with open(path, "rb") as f:
+        # zlib releases the GIL while compressing, so several of these run in parallel
+        while True:
+            buf = f.read(BACKUP_READ_CHUNK)
+            if not buf: break
+            crc = zlib.crc32(buf, crc)
+            size += len(buf)
+            chunks.append(buf if store else compressor.compress(buf))
+    if store:
+        return b"".join(chunks), crc, size, zipfile.ZIP_STORED
+    chunks.append(compressor.flush())
+    return b"".join(chunks), crc, size, zipfile.ZIP_DEFLATED
+
+def _write_precompressed(zf, zinfo, data):
+    """Appends an already deflated entry to an open ZipFile without recompressing it."""
+    # Mirrors ZipFile._open_to_write, minus the compressor
+    zf.fp.seek(zf.start_dir)
+    zinfo.header_offset = zf.fp.tell()
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zf.fp.write(zinfo.FileHeader())
+    zf.fp.write(data)
+    zf.start_dir = zf.fp.tell()
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+
+@functools.lru_cache(maxsize=None)
+def _precompressed_writes_work():
+    """Checks once per run that _write_precompressed still produces valid archives.
+
+    It relies on ZipFile internals, so instead of trusting a Python version it round-trips
+    a small in-memory zip: deflated and stored entries written that way, between entries
+    written by zipfile itself, must pass testzip() and read back byte for byte.
+    """
+    text = b"Hytale world backup self-check\n" * 64
+    blob = bytes(range(256)) * 4
     try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=4)
-    except Exception as e:
-        print(f"Error saving config: {e}")
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("head.txt", text)
+            for name, data, store in (("deflated.txt", text, False), ("stored.png", blob, True)):
+                zinfo = zipfile.ZipInfo(name, (2024, 1, 1, 0, 0, 0))
+                if store:
+                    payload, zinfo.compress_type = data, zipfile.ZIP_STORED
+                else:
+                    compressor = zlib.compressobj(BACKUP_COMPRESS_LEVEL, zlib.DEFLATED, -15)
+                    payload, zinfo.compress_type = compressor.compress(data) + compressor.flush(), zipfile.ZIP_DEFLATED
+                zinfo.CRC = zlib.crc32(data)
+                zinfo.file_size = len(data)
+                zinfo.compress_size = len(payload)
+                _write_precompressed(zf, zinfo, payload)
+            zf.writestr("tail.png", blob, compress_type=zipfile.ZIP_STORED)
+        with zipfile.ZipFile(buf) as zf:
+            expected = {"head.txt": text, "deflated.txt": text, "stored.png": blob, "tail.png": blob}
+            return zf.testzip() is None and all(zf.read(name) == data for name, data in expected.items())
+    except Exception:
+        return False
+
+def parallel_zip_dir(src_dir, zip_path, workers=None):
+    """Zips a directory, deflating files on a thread pool and writing them from one thread."""
+    workers = workers or os.cpu_count() or 1
+    dirs, files = [], []
+    for root, dirnames, filenames in os.walk(src_dir):
+        dirnames.sort()
+        for d in dirnames:
+            dirs.append(os.path.join(root, d))
+        for f in sorted(filenames):
+            files.append(os.path.join(root, f))
+
+    def write_streamed(zf, path):
+        store = os.path.splitext(path)[1].lower() in BACKUP_STORED_EXTENSIONS
+        zf.write(path, os.path.relpath(path, src_dir),
+                 compress_type=zipfile.ZIP_STORED if store else zipfile.ZIP_DEFLATED,
+                 compresslevel=None if store else BACKUP_COMPRESS_LEVEL)
+
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
+        for d in dirs:
+            zf.write(d, os.path.relpath(d, src_dir))
+
+        # Serial fallback if this Python's zipfile no longer matches what _write_precompressed expects
+        if not _precompressed_writes_work():
+            for path in files:
+                write_streamed(zf, path)
+            return
+
+        def submit(pool, path):
+            # Big files aren't compressed ahead; the writer streams them in its turn
+            if os.path.getsize(path) > BACKUP_INMEMORY_LIMIT:
+                return path, None
+            return path, pool.submit(_deflate_file, path)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            # Keep a bounded window of in-flight files so large worlds don't sit in RAM
+            pending = collections.deque()
+            file_iter = iter(files)
+            for path in file_iter:
+                pending.append(submit(pool, path))
+                if len(pending) >= workers * 2: break
+
+            while pending:
+                path, future = pending.popleft()
+                if future is None:
+                    write_streamed(zf, path)
+                else:
+                    data, crc, size, compress_type = future.result()
+                    zinfo = zipfile.ZipInfo.from_file(path, os.path.relpath(path, src_dir))
+                    zinfo.compress_type = compress_type
+                    zinfo.CRC = crc
+                    zinfo.file_size = size
+                    zinfo.compress_size = len(data)
+                    _write_precompressed(zf, zinfo, data)
+
+                nxt = next(file_iter, None)
+                if nxt is not None:
+                    pending.append(submit(pool, nxt))
+
+def _zip_mtime(info):
+    """Returns the entry's timestamp (stored as local time) as an epoch value."""
+    return time.mktime(info.date_time + (0, 0, -1))
+
+def _extract_member(zf, info, target):
+    """Streams a single zip entry to disk, stamping it with the entry's timestamp."""
+    with zf.open(info) as src, open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, length=EXTRACT_CHUNK_SIZE)
+    mtime = _zip_mtime(info)
+    os.utime(target, (mtime, mtime))
+    # Keep the executable bits of Unix-made archives (the downloader binary, scripts);
+    # other mode bits are ignored so a read-only entry can't block the next extraction
+    exec_bits = (info.external_attr >> 16) & 0o111
+    if exec_bits and info.create_system == 3 and not IS_WINDOWS:
+        os.chmod(target, os.stat(target).st_mode | exec_bits)
+
+def parallel_extract_zip(zip_path, dest_dir, workers=None, skip_unchanged=False):
+    """Extracts a zip (path or in-memory file), streaming large entries on a thread pool.
+
+    With skip_unchanged, files already on disk with the entry's size and timestamp are left alone.
+    """
+    workers = workers or min(8, os.cpu_count() or 1)
+    # Workers reopen the archive by path; an in-memory file is extracted serially
+    can_fan_out = isinstance(zip_path, (str, os.PathLike))
+    dest_root = os.path.abspath(dest_dir)
+
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        jobs = []
+        made_dirs = set()
+        for info in zf.infolist():
+            target = os.path.abspath(os.path.join(dest_root, info.filename))
+            # Same rule as extractall: never write outside the destination
+            if os.path.commonpath([dest_root, target]) != dest_root:
+                continue
+            if info.is_dir():
+                if target not in made_dirs:
+                    ensure_dir(target)
+                    made_dirs.add(target)
+                continue
+            if skip_unchanged:
+                try:
+                    st = os.stat(target)
+                    # Zip timestamps have 2 second resolution
+                    if st.st_size == info.file_size and abs(st.st_mtime - _zip_mtime(info)) <= 2:
+                        continue
+                except (OSError, OverflowError, ValueError): pass
+            # Create parents up front so workers don't race on makedirs; entries
+            # sharing a folder only pay for it once
+            parent = os.path.dirname(target)
+            if parent not in made_dirs:
+                ensure_dir(parent)
+                made_dirs.add(parent)
+            jobs.append((info, target))
+
+        large = []
+        for info, target in jobs:
+            if info.file_size < EXTRACT_SERIAL_LIMIT or not can_fan_out:
+                _extract_member(zf, info, target)
+            else:
+                large.append((info, target))
+
+        if len(large) == 1:
+            _extract_member(zf, *large[0])
+            return
+        if not large: return
+        # Start the biggest entries first so one huge file doesn't trail at the end
+        large.sort(key=lambda job: job[0].file_size, reverse=True)
+
+        # A ZipFile handle can't be shared across threads, but it can be reused:
+        # each handle parses the central directory once and serves many entries
+        handles = queue.SimpleQueue()
+        opened = []
+        def extract(info, target):
+            try:
+                h = handles.get_nowait()
+            except queue.Empty:
+                h = zipfile.ZipFile(zip_path, "r")
+                opened.append(h)
+            try:
+                _extract_member(h, info, target)
+            finally:
+                handles.put(h)
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(workers, len(large))) as pool:
+                futures = [pool.submit(extract, info, target) for info, target in large]
+                for future in futures:
+                    future.result()
+        finally:
+            for h in opened:
+                h.close()
+
+class LogFileWriter:
+    """Appends text to a log file from a background thread, so loggers never wait on disk I/O.
+
+    One buffered handle for the whole session, flushed every LOG_FLUSH_INTERVAL_MS.
+    """
+    _FLUSH = object()
+
+    def __init__(self, path):
+        self.file = open(path, "a", encoding="utf-8", buffering=LOG_FILE_BUFFER)
+        self.queue = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self._run, name="hytale-log", daemon=True)
+        self.thread.start()
+
+    def write(self, text):
+        self.queue.put(text)
+
+    def flush(self):
+        self.queue.put(self._FLUSH)
+
+    def close(self):
+        """Writes out everything queued so far and closes the file."""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join(timeout=5)
+
+    def _run(self):
+        flush_interval = LOG_FLUSH_INTERVAL_MS / 1000
+        last_flush = time.monotonic()
+        while True:
+            try:
+                batch = [self.queue.get(timeout=flush_interval)]
+            except queue.Empty:
+                self.file.flush()
+                last_flush = time.monotonic()
+                continue
+            try:
+                while True: batch.append(self.queue.get_nowait())
+            except queue.Empty: pass
+            done = None in batch
+            self.file.write("".join(item for item in batch if isinstance(item, str)))
+            if done:
+                self.file.close()
+                return
+            if self._FLUSH in batch or time.monotonic() - last_flush >= flush_interval:
+                self.file.flush()
+                last_flush = time.monotonic()
 
 class HytaleUpdaterCore:
     """Core logic for managing, updating, and monitoring the Hytale server."""
@@ -110,9 +676,22 @@ class HytaleUpdaterCore:
         self.stop_requested = False
         self.restart_timer = None
         self.update_timer = None
+        self.pending_start = None
         self.monitor_thread = None
         self.start_time = None
         self.discord_bot = None
+        self._updater_cmd = None
+        # Run before the self-update's os._exit(); the front-ends register their log flushes here
+        self.shutdown_hooks = []
+        # Set whenever no server process is running, so callers can block on shutdown
+        self.server_stopped = threading.Event()
+        self.server_stopped.set()
+        # Shared pool for short background writes (settings saves)
+        self.io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="hytale-io")
+        # Webhook messages are batched and posted by a single background thread
+        self.webhook_queue = queue.Queue()
+        self.webhook_thread = None
+        self.webhook_lock = threading.Lock()
 
         if self.config.get("enable_discord", False) and HAS_DISCORD and self.config.get("discord_token"):
              self.start_discord_bot()
@@ -122,10 +701,11 @@ class HytaleUpdaterCore:
         self.log_callback(message, tag)
         
         # Also log to rich console if in console mode
+        console = rich_console()
         if console and not tag:
              # If the message doesn't have a timestamp, add one for console
              if not message.startswith("["):
-                 ts = datetime.datetime.now().strftime("[%H:%M:%S]")
+                 ts = log_timestamp("[%H:%M:%S]")
                  console.log(f"{ts} {message}")
 
     def update_status(self, status):
@@ -140,6 +720,13 @@ class HytaleUpdaterCore:
         
         if not token: return
 
+        try:
+            import discord
+            from discord.ext import commands
+        except ImportError as e:
+            self.log(f"Discord Bot unavailable: {e}")
+            return
+
         # Define Bot Class inline to access manager instance
         class HytaleBot(commands.Bot):
             def __init__(self, manager_core):
@@ -182,7 +769,7 @@ class HytaleUpdaterCore:
             await ctx.send("🔄 Restarting server...")
             self.stop_server()
             # specific restart logic for the bot
-            threading.Timer(5.0, self.start_server_sequence).start()
+            self._schedule_start(5)
 
         def run_bot():
             try:
@@ -193,20 +780,46 @@ class HytaleUpdaterCore:
         threading.Thread(target=run_bot, daemon=True).start()
 
     def check_java_version(self):
-        """Verifies if Java 25 is installed and available."""
+        """Verifies if Java 25 (or newer) is installed and available."""
         self.log("Checking Java version...")
+        # A passing check is remembered against the java binary's identity, so the
+        # JVM only has to be spawned again after Java is upgraded or PATH changes
+        java_key = None
+        java_path = shutil.which("java")
+        if java_path:
+            try:
+                real_path = os.path.realpath(java_path)
+                st = os.stat(real_path)
+                java_key = [real_path, st.st_mtime_ns, st.st_size]
+            except OSError: pass
+        cached = self.config.get("java_check") or {}
+        # The requirement can rise with a manager update, so the cached version is re-checked
+        if java_key and cached.get("key") == java_key and cached.get("version", 0) >= JAVA_VERSION_REQ:
+            self.log(f"Java {cached.get('version')} detected (cached).")
+            return True
+
         try:
-            result = subprocess.run(["java", "-version"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-            output = result.stdout
-            if 'version "25' in output or 'version "1.25' in output:
-                self.log("Java 25 detected.")
+            # -version prints to stderr; merge it so one regex search covers all vendors.
+            # Matched as bytes: the output is only decoded if it has to be shown.
+            result = subprocess.run(["java", "-version"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=JAVA_CHECK_TIMEOUT)
+            m = JAVA_VERSION_RE.search(result.stdout)
+            java_version = int(m.group(1)) if m else 0
+            if java_version >= JAVA_VERSION_REQ:
+                self.log(f"Java {java_version} detected.")
+                if java_key:
+                    self.config["java_check"] = {"key": java_key, "version": java_version}
+                    save_config(self.config)
                 return True
             else:
-                self.log(f"WARNING: Java 25 not detected. Output:\n{output}")
+                output = result.stdout.decode(errors="replace")
+                self.log(f"WARNING: Java {JAVA_VERSION_REQ} not detected. Output:\n{output}")
                 return False
         except FileNotFoundError:
             self.log("ERROR: Java not found in PATH.")
             return False
+        except subprocess.TimeoutExpired:
+            self.log(f"ERROR: 'java -version' did not answer within {JAVA_CHECK_TIMEOUT}s.")
+            return False
 
     def check_assets(self):
         """Checks if the required assets file exists, asking the user if missing."""
@@ -227,9 +840,15 @@ class HytaleUpdaterCore:
 
             if user_path and os.path.exists(user_path) and os.path.basename(user_path) == ASSETS_FILE:
                  try:
-                     shutil.copy(user_path, cwd)
-                     self.log(f"Copied {ASSETS_FILE} to server directory.")
-                     return os.path.join(cwd, ASSETS_FILE)
+                     # Assets.zip is large: hardlink it on the same filesystem (updates replace
+                     # the file rather than writing into it), otherwise copy it in-kernel
+                     try:
+                         os.link(user_path, assets_path)
+                         self.log(f"Linked {ASSETS_FILE} into server directory.")
+                     except OSError:
+                         fast_copy(user_path, assets_path)
+                         self.log(f"Copied {ASSETS_FILE} to server directory.")
+                     return assets_path
                  except Exception as e:
                      self.log(f"Error copying file: {e}")
                      return None
@@ -237,78 +856,144 @@ class HytaleUpdaterCore:
 
     def ensure_updater(self):
         """Ensures the Hytale updater executable is available."""
-        # Check for standard executable name or platform specific names
-        candidates = [UPDATER_EXECUTABLE]
-        if IS_WINDOWS:
-            candidates.append("hytale-downloader-windows-amd64.exe")
-        else:
-            candidates.append("hytale-downloader-linux-amd64")
-            
-        for cand in candidates:
-            if os.path.exists(cand):
-                 if not IS_WINDOWS and not os.access(cand, os.X_OK):
-                     try: os.chmod(cand, 0o755)
-                     except: pass
-                 return [f"./{cand}"] if not IS_WINDOWS else [cand]
+        # Reuse the last resolved command while its file is unchanged
+        if self._updater_cmd:
+            cmd, path, mtime = self._updater_cmd
+            try:
+                if os.stat(path).st_mtime_ns == mtime: return list(cmd)
+            except OSError: pass
+            self._updater_cmd = None
+
+        cmd = self._resolve_updater()
+        if cmd:
+            path = cmd[2] if cmd[0] == "java" else cmd[0]
+            try: self._updater_cmd = (list(cmd), path, os.stat(path).st_mtime_ns)
+            except OSError: pass
+        return cmd
 
-        if os.path.exists("hytale-downloader.jar"):
-            return ["java", "-jar", "hytale-downloader.jar"]
+    def _resolve_updater(self):
+        """Finds, downloads or extracts the updater and returns the command to run it."""
+        cmd = self._find_updater_candidate()
+        if cmd: return cmd
+
+        if os.path.exists(UPDATER_JAR_CMD[2]):
+            return list(UPDATER_JAR_CMD)
 
         self.log(f"Updater executable not found. Checking for cached zip: {UPDATER_ZIP_FILE}...")
         
-        should_download = True
-        if os.path.exists(UPDATER_ZIP_FILE):
-             try:
-                 self.log(f"Found cached {UPDATER_ZIP_FILE}, checking remote size...")
-                 req = urllib.request.Request(UPDATER_ZIP_URL, method='HEAD', headers={'User-Agent': 'Mozilla/5.0'})
-                 with urllib.request.urlopen(req) as response:
-                     remote_size = int(response.headers.get('Content-Length', 0))
-                     local_size = os.path.getsize(UPDATER_ZIP_FILE)
-                     
-                     if remote_size > 0 and remote_size == local_size:
-                         self.log("Local zip matches remote size. Skipping download.")
-                         should_download = False
-                     else:
-                         self.log(f"Size mismatch (Local: {local_size}, Remote: {remote_size}). Redownloading...")
-             except Exception as e:
-                 self.log(f"Error checking remote size: {e}. forcing download.")
-
-        if should_download:
-            self.log(f"Updater not found in cache or invalid. Downloading from {UPDATER_ZIP_URL}...")
-            try:
-                req = urllib.request.Request(UPDATER_ZIP_URL, headers={'User-Agent': 'Mozilla/5.0'})
-                with urllib.request.urlopen(req) as response:
-                    with open(UPDATER_ZIP_FILE, "wb") as f:
-                        f.write(response.read())
-            except Exception as e:
-                 self.log(f"Download failed: {e}")
-                 return None
+        headers = {'User-Agent': 'Mozilla/5.0', 'Accept-Encoding': 'identity'}
+        has_cache = os.path.exists(UPDATER_ZIP_FILE)
+        if has_cache:
+            # Conditional GET: a 304 means the cached zip is current, a 200 carries the new one
+            self.log(f"Found cached {UPDATER_ZIP_FILE}, checking if it is still current...")
+            if self.config.get("updater_etag"):
+                headers['If-None-Match'] = self.config["updater_etag"]
+            if self.config.get("updater_last_modified"):
+                headers['If-Modified-Since'] = self.config["updater_last_modified"]
+        else:
+            self.log(f"Updater not found in cache. Downloading from {UPDATER_ZIP_URL}...")
+
+        part_file = UPDATER_ZIP_FILE + ".part"
+        downloaded = None
+        try:
+            req = urllib.request.Request(UPDATER_ZIP_URL, headers=headers)
+            with urllib.request.urlopen(req) as response:
+                size = int(response.headers.get('Content-Length') or 0)
+                if 0 < size <= UPDATER_MEMORY_LIMIT:
+                    # Small archive: keep the bytes and extract from memory instead
+                    # of reading the cache file back from disk
+                    downloaded = io.BytesIO()
+                    shutil.copyfileobj(response, downloaded, length=DOWNLOAD_CHUNK_SIZE)
+                    with open(part_file, "wb") as f:
+                        f.write(downloaded.getbuffer())
+                else:
+                    with open(part_file, "wb") as f:
+                        # Reserve the whole file up front so it lands in contiguous extents
+                        if size and hasattr(os, "posix_fallocate"):
+                            try: os.posix_fallocate(f.fileno(), 0, size)
+                            except OSError: pass
+                        shutil.copyfileobj(response, f, length=DOWNLOAD_CHUNK_SIZE)
+                        # Content-Length may have overstated the body; drop unused space
+                        if size: f.truncate()
+                os.replace(part_file, UPDATER_ZIP_FILE)
+                self.config["updater_etag"] = response.headers.get('ETag', "")
+                self.config["updater_last_modified"] = response.headers.get('Last-Modified', "")
+                save_config(self.config)
+            if has_cache:
+                self.log("Cached zip was outdated. Downloaded the new version.")
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and has_cache:
+                self.log("Cached zip matches remote. Skipping download.")
+            elif has_cache:
+                self.log(f"Error checking remote zip: {e}. Using cached copy.")
+            else:
+                self.log(f"Download failed: {e}")
+                return None
+        except Exception as e:
+            # Don't leave a partial zip behind, it would pass as a cached copy next time
+            try: os.remove(part_file)
+            except OSError: pass
+            if not has_cache:
+                self.log(f"Download failed: {e}")
+                return None
+            self.log(f"Error checking remote zip: {e}. Using cached copy.")
 
         try:
-            with zipfile.ZipFile(UPDATER_ZIP_FILE, 'r') as zip_ref:
-                zip_ref.extractall(".")
+            self._extract_updater_zip(downloaded)
             
             # Re-check for candidates after extraction
-            for cand in candidates:
-                if os.path.exists(cand):
-                    if not IS_WINDOWS and not os.access(cand, os.X_OK):
-                        try: os.chmod(cand, 0o755)
-                        except: pass
-                    return [f"./{cand}"] if not IS_WINDOWS else [cand]
-            
-            # Fallback scan
-            for f in os.listdir('.'):
-                if "hytale-downloader" in f:
-                    if f.endswith(".jar"): return ["java", "-jar", f]
-                    if IS_WINDOWS and f.endswith(".exe"): return [f]
-                    if not IS_WINDOWS and "." not in f:
-                        os.chmod(f, 0o755)
-                        return [f"./{f}"]
-            return None
+            cmd = self._find_updater_candidate()
+            if cmd: return cmd
+
+            # Fallback scan: a native build wins right away, a jar is only kept
+            # in case no native build turns up in the same pass
+            jar = None
+            with os.scandir(".") as it:
+                for entry in it:
+                    m = UPDATER_NAME_RE.fullmatch(entry.name)
+                    if not m or not entry.is_file(): continue
+                    ext = m.group(1)
+                    if ext == ".jar":
+                        jar = jar or entry.name
+                    elif IS_WINDOWS and ext == ".exe":
+                        return [entry.name]
+                    elif not IS_WINDOWS and not ext:
+                        os.chmod(entry.name, 0o755)
+                        return [f"./{entry.name}"]
+            return ["java", "-jar", jar] if jar else None
         except Exception as e:
             self.log(f"Failed to download/extract updater: {e}")
             return None
 
+    def _extract_updater_zip(self, downloaded=None):
+        """Extracts the updater zip (or its in-memory copy) into the working directory."""
+        libarchive = load_libarchive()
+        if libarchive:
+            # C extractor when installed: one sequential pass, no per-entry Python objects
+            try:
+                flags = (libarchive.extract.EXTRACT_SECURE_NODOTDOT | libarchive.extract.EXTRACT_SECURE_NOABSOLUTEPATHS
+                         | libarchive.extract.EXTRACT_SECURE_SYMLINKS | libarchive.extract.EXTRACT_PERM)
+                if downloaded is not None:
+                    libarchive.extract_memory(downloaded.getvalue(), flags)
+                else:
+                    libarchive.extract_file(UPDATER_ZIP_FILE, flags)
+                return
+            except Exception as e:
+                self.log(f"libarchive extraction failed ({e}), falling back to zipfile.")
+            if downloaded is not None: downloaded.seek(0)
+        parallel_extract_zip(downloaded if downloaded is not None else UPDATER_ZIP_FILE, ".", skip_unchanged=True)
+
+    def _find_updater_candidate(self):
+        """Returns the command for the first updater executable present, or None."""
+        for cand in UPDATER_CANDIDATES:
+            if os.path.exists(cand):
+                if IS_WINDOWS: return [cand]
+                if not os.access(cand, os.X_OK):
+                    try: os.chmod(cand, 0o755)
+                    except OSError: pass
+                return [f"./{cand}"]
+        return None
+
     def resolve_command_path(self, cmd_list):
         """Resolves absolute paths for command execution."""
         new_cmd = cmd_list.copy()
@@ -322,37 +1007,89 @@ class HytaleUpdaterCore:
                  new_cmd[2] = os.path.abspath(new_cmd[2])
         return new_cmd
 
+    def _find_server_procs(self):
+        """psutil only: returns the Process objects of running java processes running SERVER_JAR."""
+        psutil = load_psutil()
+        own_pid = os.getpid()
+        procs = []
+        for p in psutil.process_iter(['pid', 'name', 'cmdline']):
+            cmdline = p.info['cmdline'] or ()
+            if p.info['pid'] == own_pid or not (p.info['name'] or "").lower().startswith("java"):
+                continue
+            if any(SERVER_JAR in arg for arg in cmdline):
+                procs.append(p)
+        return procs
+
+    def _find_server_pids(self):
+        """Returns the PIDs of running java processes whose command line contains SERVER_JAR."""
+        # Only java processes count; a shell or editor that merely mentions the jar is left alone
+        own_pid = os.getpid()
+        pids = []
+        if load_psutil():
+            pids = [p.pid for p in self._find_server_procs()]
+        elif os.path.isdir("/proc"):
+            # Read cmdlines straight from procfs instead of forking pgrep
+            needle = SERVER_JAR.encode()
+            for entry in os.scandir("/proc"):
+                if not entry.name.isdigit(): continue
+                try:
+                    with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                        cmdline = f.read()
+                    if needle in cmdline and os.path.basename(cmdline.split(b"\0", 1)[0]).startswith(b"java"):
+                        pid = int(entry.name)
+                        if pid != own_pid: pids.append(pid)
+                except OSError: pass
+        elif IS_WINDOWS:
+            for pid, cmdline in win32_java_processes():
+                if pid != own_pid and SERVER_JAR in cmdline:
+                    pids.append(pid)
+        else:
+            result = subprocess.run(["pgrep", "-f", f"java.*{re.escape(SERVER_JAR)}"], capture_output=True, text=True)
+            if result.returncode == 0:
+                pids.extend(int(pid) for pid in result.stdout.split() if pid.isdigit())
+        return pids
+
     def stop_existing_server_process(self):
         """Detects and stops any running instance of the Hytale server."""
         self.log("Checking for running Hytale server...")
-        if IS_WINDOWS:
-            try:
-                cmd = 'wmic process where "name=\'java.exe\'" get commandline, processid'
-                result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
-                for line in result.stdout.splitlines():
-                    if SERVER_JAR in line:
-                        parts = line.split()
-                        if parts:
-                            pid = parts[-1].strip()
-                            if pid.isdigit():
-                                self.log(f"Found running server (PID: {pid}). Stopping...")
-                                subprocess.run(f"taskkill /PID {pid} /F", shell=True)
-            except Exception: pass
-        else:
-             try:
-                cmd = ["pgrep", "-f", SERVER_JAR]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0 and result.stdout.strip():
-                    for pid in result.stdout.strip().splitlines():
-                        self.log(f"Found running server (PID: {pid}). Stopping...")
-                        subprocess.run(["kill", pid])
-             except Exception: pass
+        psutil = load_psutil()
+        try:
+            if psutil:
+                # Same code on every platform: ask nicely, then kill whatever is left.
+                # The Process objects from the scan are used directly, so a PID that
+                # got reused in the meantime is never signalled.
+                procs = []
+                for proc in self._find_server_procs():
+                    self.log(f"Found running server (PID: {proc.pid}). Stopping...")
+                    try:
+                        proc.terminate()
+                        procs.append(proc)
+                    except psutil.Error: pass
+                _, alive = psutil.wait_procs(procs, timeout=5)
+                for proc in alive:
+                    try: proc.kill()
+                    except psutil.Error: pass
+                return
+
+            pids = self._find_server_pids()
+            for pid in pids:
+                self.log(f"Found running server (PID: {pid}). Stopping...")
+                if not IS_WINDOWS:
+                    try: os.kill(pid, signal.SIGTERM)
+                    except OSError: pass
+            if IS_WINDOWS and pids:
+                # taskkill takes any number of /PID flags: one spawn for all of them
+                args = ["taskkill", "/F"]
+                for pid in pids: args += ["/PID", str(pid)]
+                subprocess.run(args, capture_output=True)
+        except Exception: pass
 
     def get_remote_server_version(self, updater_cmd):
         """Queries the updater for the latest remote server version."""
         try:
             cmd = updater_cmd + ["-print-version"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Only stdout is used; discarding stderr saves a second pipe and reader
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
             if result.returncode == 0:
                 return result.stdout.strip()
             return None
@@ -366,13 +1103,23 @@ class HytaleUpdaterCore:
 
         # Add cache buster
         ts = int(time.time())
-        VERSION_URL = f"https://raw.githubusercontent.com/UnDadFeated/Hytale_Server_Manager/master/version.py?t={ts}"
-        MANAGER_URL = f"https://raw.githubusercontent.com/UnDadFeated/Hytale_Server_Manager/master/hytale_server_manager.py?t={ts}"
+        VERSION_PATH = f"{SELF_UPDATE_PATH}/version.py?t={ts}"
+        MANAGER_PATH = f"{SELF_UPDATE_PATH}/hytale_server_manager.py?t={ts}"
+
+        # One keep-alive connection serves every request below (single TLS handshake)
+        conn = https_connection(SELF_UPDATE_HOST)
+
+        def fetch(path):
+            conn.request("GET", path, headers={'User-Agent': 'HytaleManagerUpdater'})
+            response = conn.getresponse()
+            if response.status != 200:
+                response.read()
+                raise OSError(f"HTTP {response.status} {response.reason} for {path}")
+            return response
         
         try:
-            req = urllib.request.Request(VERSION_URL, headers={'User-Agent': 'HytaleManagerUpdater'})
-            with urllib.request.urlopen(req) as response:
-                remote_version_content = response.read().decode('utf-8')
+            remote_version_bytes = fetch(VERSION_PATH).read()
+            remote_version_content = remote_version_bytes.decode('utf-8')
             
             remote_version = None
             for line in remote_version_content.splitlines():
@@ -386,20 +1133,15 @@ class HytaleUpdaterCore:
 
             local_version = version.__version__
             
-            # Semantic version comparison
-            def parse_ver(v): return [int(x) for x in v.split('.')]
-            
-            if parse_ver(remote_version) > parse_ver(local_version):
+            if is_newer_version(remote_version, local_version):
                 self.log(f"New manager version found ({remote_version}). Downloading...")
                 
-                # Download files
-                req_ver = urllib.request.Request(VERSION_URL, headers={'User-Agent': 'HytaleManagerUpdater'})
-                with urllib.request.urlopen(req_ver) as response:
-                    with open("version.py.new", "wb") as f: f.write(response.read())
-                    
-                req_mgr = urllib.request.Request(MANAGER_URL, headers={'User-Agent': 'HytaleManagerUpdater'})
-                with urllib.request.urlopen(req_mgr) as response:
-                    with open("hytale_server_manager.py.new", "wb") as f: f.write(response.read())
+                # version.py was already fetched above, no need to download it again
+                with open("version.py.new", "wb") as f: f.write(remote_version_bytes)
+
+                response = fetch(MANAGER_PATH)
+                with open("hytale_server_manager.py.new", "wb") as f:
+                    shutil.copyfileobj(response, f, length=DOWNLOAD_CHUNK_SIZE)
                 
                 self.log("Files downloaded. Preparing installer...")
                 self.run_update_installer()
@@ -408,6 +1150,8 @@ class HytaleUpdaterCore:
 
         except Exception as e:
             self.log(f"Failed to check/update manager: {e}")
+        finally:
+            conn.close()
 
     def run_update_installer(self):
         """Generates and runs the separate installer script."""
@@ -423,9 +1167,9 @@ print(f"Waiting for parent process {{pid}} to close...")
 def is_pid_running(p):
     try:
         if os.name == 'nt':
-            # tasklist returns filter info if process not found or PID if found
-            output = subprocess.check_output(f'tasklist /FI "PID eq {{p}}"', shell=True).decode()
-            return str(p) in output
+            # CSV rows quote every field, so match the PID column exactly; no match prints an INFO line
+            output = subprocess.check_output(["tasklist", "/FI", f"PID eq {{p}}", "/NH", "/FO", "CSV"]).decode()
+            return f'"{{p}}"' in output
         else:
             os.kill(p, 0)
             return True
@@ -444,14 +1188,13 @@ try:
     print("Updating files...")
     time.sleep(2) # Extra buffer
     
+    # os.replace overwrites atomically, so there is never a moment without the file
     if os.path.exists("version.py.new"):
-        if os.path.exists("version.py"): os.remove("version.py")
-        os.rename("version.py.new", "version.py")
+        os.replace("version.py.new", "version.py")
         print("Updated version.py")
         
     if os.path.exists("hytale_server_manager.py.new"):
-        if os.path.exists("hytale_server_manager.py"): os.remove("hytale_server_manager.py")
-        os.rename("hytale_server_manager.py.new", "hytale_server_manager.py")
+        os.replace("hytale_server_manager.py.new", "hytale_server_manager.py")
         print("Updated hytale_server_manager.py")
         
     print("Files updated. Restarting manager...")
@@ -466,9 +1209,49 @@ except Exception as e:
             f.write(installer_code)
             
         self.log("Launching installer and exiting...")
+        # os._exit skips atexit, so buffered logs and pending saves are written out here
+        for hook in self.shutdown_hooks:
+            try: hook()
+            except Exception: pass
         subprocess.Popen([sys.executable, "updater_installer.py"])
         os._exit(0)
 
+    def _remove_path(self, path):
+        """Removes a file or directory tree if it exists."""
+        try: st = os.lstat(path)
+        except FileNotFoundError: return
+        if stat.S_ISDIR(st.st_mode):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            os.remove(path)
+
+    def _move_into_place(self, src, dest, src_st=None):
+        """Swaps src into dest with a rename, copying only if they are on different filesystems."""
+        old = dest + ".old"
+        self._remove_path(old)
+        try:
+            os.replace(dest, old)
+            had_dest = True
+        except FileNotFoundError:
+            had_dest = False
+        try:
+            try:
+                os.replace(src, dest)
+            except OSError as e:
+                if e.errno != errno.EXDEV: raise
+                if src_st is None: src_st = os.lstat(src)
+                if stat.S_ISDIR(src_st.st_mode): shutil.copytree(src, dest, copy_function=fast_copy)
+                else: fast_copy(src, dest)
+        except Exception:
+            # Put the previous version back so the server stays runnable
+            if had_dest:
+                self._remove_path(dest)
+                os.replace(old, dest)
+            raise
+        if had_dest:
+            try: self._remove_path(old)
+            except OSError: pass
+
     def _install_from_zip_or_folder(self, staging_dir, specific_zip=None):
         """Helper to extract and install server files from a zip or folder in staging."""
         extracted_root = os.path.join(staging_dir, "extracted")
@@ -487,7 +1270,7 @@ except Exception as e:
                     try:
                         assets_info = zip_ref.getinfo("Assets.zip")
                         local_assets = os.path.join(os.getcwd(), "Assets.zip")
-                        if not os.path.exists(local_assets) or os.path.getsize(local_assets) != assets_info.file_size:
+                        if file_size(local_assets) != assets_info.file_size:
                             assets_needs_update = True
                     except KeyError:
                         pass # Assets.zip not in this zip (unlikely for server zip)
@@ -502,7 +1285,7 @@ except Exception as e:
                     
                     if jar_info:
                         local_jar = os.path.join(os.getcwd(), "HytaleServer.jar")
-                        if not os.path.exists(local_jar) or os.path.getsize(local_jar) != jar_info.file_size:
+                        if file_size(local_jar) != jar_info.file_size:
                             server_needs_update = True
                     else:
                         server_needs_update = True # Jar not found in zip? Suspicious, force extract.
@@ -539,36 +1322,34 @@ except Exception as e:
         any_replaced = False
         if files_ready_to_copy:
             # 1. Look for Assets.zip
+            # One lstat per candidate instead of separate exists/isdir probes
+            cwd = os.getcwd()
             for base in source_bases:
                 assets_src = os.path.join(base, ASSETS_FILE)
-                if os.path.exists(assets_src):
-                    try:
-                        dest = os.path.join(os.getcwd(), ASSETS_FILE)
-                        if os.path.exists(dest): os.remove(dest)
-                        shutil.copy2(assets_src, dest)
-                        self.log(f"Replaced {ASSETS_FILE} from {assets_src}")
-                        any_replaced = True
-                    except Exception as e: self.log(f"Error moving Assets.zip: {e}")
-                    break
+                try: src_st = os.lstat(assets_src)
+                except FileNotFoundError: continue
+                try:
+                    dest = os.path.join(cwd, ASSETS_FILE)
+                    self._move_into_place(assets_src, dest, src_st)
+                    self.log(f"Replaced {ASSETS_FILE} from {assets_src}")
+                    any_replaced = True
+                except Exception as e: self.log(f"Error moving Assets.zip: {e}")
+                break
             
             # 2. Look for Server components
             server_components = [SERVER_JAR, AOT_FILE, "Licenses"]
             for comp in server_components:
                 for base in source_bases:
                     src = os.path.join(base, comp)
-                    if os.path.exists(src):
-                        try:
-                            dest = os.path.join(os.getcwd(), comp)
-                            if os.path.isdir(src):
-                                if os.path.exists(dest): shutil.rmtree(dest)
-                                shutil.copytree(src, dest)
-                            else:
-                                if os.path.exists(dest): os.remove(dest)
-                                shutil.copy2(src, dest)
-                            self.log(f"Replaced {comp} from {src}")
-                            any_replaced = True
-                        except Exception as e: self.log(f"Error moving {comp}: {e}")
-                        break
+                    try: src_st = os.lstat(src)
+                    except FileNotFoundError: continue
+                    try:
+                        dest = os.path.join(cwd, comp)
+                        self._move_into_place(src, dest, src_st)
+                        self.log(f"Replaced {comp} from {src}")
+                        any_replaced = True
+                    except Exception as e: self.log(f"Error moving {comp}: {e}")
+                    break
 
         if not any_replaced:
             self.log("WARNING: No files were replaced during install attempt.")
@@ -576,8 +1357,11 @@ except Exception as e:
         
         return True
 
-    def update_server(self):
-        """Handles the server update process using the Hytale downloader."""
+    def update_server(self, remote_query=None):
+        """Handles the server update process using the Hytale downloader.
+
+        remote_query may be a future already fetching the remote version.
+        """
         updater_cmd = self.ensure_updater()
         
         if not updater_cmd:
@@ -588,12 +1372,20 @@ except Exception as e:
 
         resolved_cmd = self.resolve_command_path(updater_cmd)
 
-        remote_version = self.get_remote_server_version(resolved_cmd)
+        if remote_query:
+            remote_version = remote_query.result()
+        else:
+            remote_version = self.get_remote_server_version(resolved_cmd)
         local_version = self.config.get("last_server_version", "0.0.0")
 
         if remote_version:
             self.log(f"Remote version: {remote_version}")
             if remote_version == local_version:
+                # Nothing to verify if the installed files are exactly what the last install left
+                fingerprint = self._install_fingerprint(remote_version)
+                if fingerprint and self.config.get("installed_fingerprint") == fingerprint:
+                    self.log(f"Server files unchanged since installing {remote_version}. Skipping update.")
+                    return
                 self.log(f"Config ver matches remote ({remote_version}). Checking file integrity...")
             else:
                 self.log(f"New version available (Old: {local_version}, New: {remote_version}).")
@@ -602,8 +1394,7 @@ except Exception as e:
 
         try:
             staging_dir = os.path.abspath("updater_staging")
-            if not os.path.exists(staging_dir):
-                os.makedirs(staging_dir)
+            ensure_dir(staging_dir)
             
             # PRE-CHECK: existing zip?
             install_success = False
@@ -630,9 +1421,9 @@ except Exception as e:
                 self.log(f"Running updater in: {staging_dir}...")
                 
                 # Run the downloader CLI
-                process = subprocess.Popen(resolved_cmd, cwd=staging_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-                for line in iter(process.stdout.readline, ''):
-                    if line: self.log(f"[Updater] {line.strip()}")
+                # Stream its output through the same chunked reader as the server
+                process = subprocess.Popen(resolved_cmd, cwd=staging_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+                self._read_stream(process.stdout, None, prefix="[Updater] ")
                 process.wait()
                 
                 if process.returncode == 0:
@@ -649,8 +1440,10 @@ except Exception as e:
                 
                 if remote_version and remote_version != local_version:
                      self.config["last_server_version"] = remote_version
-                     save_config(self.config)
                      self.log(f"Updated local version record to {remote_version}")
+                if remote_version:
+                    self.config["installed_fingerprint"] = self._install_fingerprint(remote_version)
+                save_config(self.config)
 
                 # SUCCESS: Clean up extracted files only - KEEP THE ZIP for future verification
                 try:
@@ -665,10 +1458,8 @@ except Exception as e:
             if os.path.exists(staging_dir):
                 artifacts = ["QUICKSTART.md", "hytale-downloader-windows-amd64.exe", "hytale-downloader-linux-amd64", "hytale-downloader"]
                 for f in artifacts:
-                    p = os.path.join(staging_dir, f)
-                    if os.path.exists(p):
-                        try: os.remove(p)
-                        except: pass
+                    try: os.remove(os.path.join(staging_dir, f))
+                    except OSError: pass
                 
                 # Cleanup OLD zips (Prune cache)
                 # We want to keep ONLY the zip that matches remote_version (or the one we just installed)
@@ -685,6 +1476,17 @@ except Exception as e:
             self.log(f"Update failed: {e}")
             self.log(traceback.format_exc())
 
+    def _install_fingerprint(self, server_version):
+        """Identifies an install by version plus the size/mtime of the main server files."""
+        fingerprint = [server_version]
+        for name in (SERVER_JAR, ASSETS_FILE):
+            try:
+                st = os.stat(name)
+                fingerprint.append([name, st.st_size, st.st_mtime_ns])
+            except OSError:
+                return None
+        return fingerprint
+
     def send_command(self, command):
         """Sends a console command to the running server process."""
         if self.server_process and self.server_process.poll() is None:
@@ -698,6 +1500,19 @@ except Exception as e:
         else:
              self.log("Server is not running.")
 
+    def _world_fingerprint(self):
+        """Hashes the path, size and mtime of every world file (contents are not read)."""
+        h = hashlib.blake2b(digest_size=16)
+        for root, dirs, files in os.walk(WORLD_DIR):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                st = os.stat(path)
+                h.update(os.path.relpath(path, WORLD_DIR).encode("utf-8", "surrogateescape"))
+                h.update(st.st_size.to_bytes(8, "little"))
+                h.update(st.st_mtime_ns.to_bytes(8, "little", signed=True))
+        return h.hexdigest()
+
     def backup_world(self):
         """Creates a backup of the world directory."""
         if not self.config.get("enable_backups", True): return
@@ -706,40 +1521,102 @@ except Exception as e:
              self.log(f"Backup skipped: World directory not found at {WORLD_DIR}")
              return
 
+        try:
+            fingerprint = self._world_fingerprint()
+        except OSError as e:
+            self.log(f"Could not fingerprint world, backing up anyway: {e}")
+            fingerprint = None
+
+        last_backup = self.config.get("last_world_backup", "")
+        if fingerprint and fingerprint == self.config.get("last_world_fingerprint") and last_backup and os.path.exists(last_backup):
+            self.log(f"Backup skipped: World unchanged since {last_backup}")
+            return
+
         self.log(f"Creating world backup from {WORLD_DIR}...")
-        if not os.path.exists(BACKUP_DIR): os.makedirs(BACKUP_DIR)
+        ensure_dir(BACKUP_DIR)
 
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         backup_name = os.path.join(BACKUP_DIR, f"world_backup_{timestamp}")
         
         try:
-            shutil.make_archive(backup_name, 'zip', WORLD_DIR)
+            parallel_zip_dir(WORLD_DIR, f"{backup_name}.zip")
             self.log(f"Backup created: {backup_name}.zip")
+
+            if fingerprint:
+                self.config["last_world_fingerprint"] = fingerprint
+                self.config["last_world_backup"] = f"{backup_name}.zip"
+                save_config(self.config)
             
             max_b = int(self.config.get("max_backups", 3))
-            backups = sorted([f for f in os.listdir(BACKUP_DIR) if f.startswith("world_backup_") and f.endswith(".zip")])
+            with os.scandir(BACKUP_DIR) as it:
+                backups = sorted((e for e in it if e.name.startswith("world_backup_") and e.name.endswith(".zip") and e.is_file(follow_symlinks=False)), key=lambda e: e.name)
             if len(backups) > max_b:
                 for old in backups[:-max_b]:
-                    try: os.remove(os.path.join(BACKUP_DIR, old))
-                    except: pass
+                    try: os.remove(old.path)
+                    except OSError: pass
         except Exception as e:
             self.log(f"Backup failed: {e}")
 
     def send_discord_webhook(self, message):
-        """Sends a status message to the configured Discord webhook."""
+        """Queues a status message for the configured Discord webhook without blocking."""
         if not self.config.get("enable_discord", False): return
         url = self.config.get("discord_webhook", "").strip()
         if not url: return
+        with self.webhook_lock:
+            if not self.webhook_thread:
+                self.webhook_thread = threading.Thread(target=self._webhook_loop, daemon=True)
+                self.webhook_thread.start()
+        self.webhook_queue.put((url, message))
+
+    def _webhook_loop(self):
+        """Posts queued webhook messages, merging events that arrive close together."""
+        conns = {}
+        while True:
+            batch = [self.webhook_queue.get()]
+            # Give related events (e.g. "stopped" + "restarting") a moment to arrive
+            time.sleep(WEBHOOK_BATCH_DELAY)
+            try:
+                while True: batch.append(self.webhook_queue.get_nowait())
+            except queue.Empty: pass
 
-        try:
-            data = json.dumps({"content": message}).encode('utf-8')
-            req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json', 'User-Agent': 'HytaleUpdater'})
-            with urllib.request.urlopen(req) as r: pass
-        except Exception as e:
-            self.log(f"Discord Webhook Failed: {e}")
+            for url, items in itertools.groupby(batch, key=lambda item: item[0]):
+                content = "\n".join(message for _, message in items)
+                try:
+                    self._post_discord_webhook(conns, url, content)
+                except Exception as e:
+                    self.log(f"Discord Webhook Failed: {e}")
+
+    def _post_discord_webhook(self, conns, url, content):
+        """Posts content to a webhook, reusing a keep-alive connection per host."""
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        data = json.dumps({"content": content}).encode('utf-8')
+        headers = {'Content-Type': 'application/json', 'User-Agent': 'HytaleUpdater'}
+
+        for attempt in range(2):
+            conn = conns.get(parts.netloc)
+            if conn is None:
+                conn = conns[parts.netloc] = https_connection(parts.netloc)
+            try:
+                conn.request("POST", path, body=data, headers=headers)
+                response = conn.getresponse()
+                response.read()
+            except (http.client.HTTPException, OSError):
+                # The server may have dropped the idle connection; reconnect once
+                conn.close()
+                del conns[parts.netloc]
+                if attempt: raise
+                continue
+            if response.status >= 400:
+                raise OSError(f"HTTP {response.status} {response.reason}")
+            return
 
     def start_server_sequence(self):
         """Initiates the server startup sequence in a separate thread."""
+        # A manual Start during a restart countdown replaces the countdown; left
+        # armed, its second start would kill the server started here
+        if self.pending_start:
+            self.pending_start.cancel()
         t = threading.Thread(target=self._start_server_thread)
         t.daemon = True
         t.start()
@@ -748,26 +1625,44 @@ except Exception as e:
         """Internal method to handle the server startup steps."""
         self.stop_requested = False
         
-        # 1. Manager Update Check
-        self.check_self_update()
+        # 1. Manager Update Check (network) runs alongside 2. Java Check, followed
+        # by the updater download (if needed) so 3. finds it ready. The download
+        # must come after the self-update: that one may os._exit() the manager,
+        # which would leave a half-written updater binary behind
+        def self_update_then_updater():
+            self.check_self_update()
+            if self.config.get("check_updates", True):
+                return self.ensure_updater()
+            return None
 
-        # 2. Java Check
-        if not self.check_java_version(): return
+        prefetch = run_in_thread(self_update_then_updater)
+        java_ok = self.check_java_version()
+        updater_cmd = prefetch.result()
+        if not java_ok: return
+        if self._start_cancelled(): return
 
-        # 3. Server Check (and Downloader)
+        # The remote version query is a network round trip through the updater;
+        # it overlaps with stopping the old server instead of following it
+        remote_query = None
+        if updater_cmd:
+            remote_query = run_in_thread(self.get_remote_server_version, self.resolve_command_path(updater_cmd))
+
+        # Stop any running server first, both the update and the backup need it gone
+        self.stop_existing_server_process()
+
+        # 3. Server Check (and Downloader) and 5. Backup World touch different
+        # directories, so the backup runs while the update downloads
+        backup = run_in_thread(self.backup_world)
         if self.config.get("check_updates", True):
-            self.stop_existing_server_process() # Stop before update to be safe
-            self.update_server()
+            self.update_server(remote_query)
+        backup.result()
+        if self._start_cancelled(): return
 
         # 4. Assets Check
         assets_path = self.check_assets()
         if not assets_path: return
-
-        # Ensure server is stopped before start (redundant but safe if updates disabled)
-        self.stop_existing_server_process()
-
-        # 5. Backup World
-        self.backup_world()
+        # Last chance before a JVM exists that would outlive a manager being closed
+        if self._start_cancelled(): return
 
         self.log("Starting Server...")
         self.send_discord_webhook("🟢 Hytale Server Starting...")
@@ -777,26 +1672,41 @@ except Exception as e:
         env = os.environ.copy()
         env["_JAVA_OPTIONS"] = f"-Xmx{memory}"
         
-        cmd = ["java", f"-Xmx{memory}"]
-        if os.path.exists(AOT_FILE):
-             self.log(f"Using AOT Cache: {AOT_FILE}")
-             cmd.append(f"-XX:AOTCache={AOT_FILE}")
-        cmd.extend(["-jar", SERVER_JAR, "--assets", assets_path])
+        # AOT presence is re-checked each launch: the update step may have just added or removed it
+        use_aot = os.path.exists(AOT_FILE)
+        if use_aot: self.log(f"Using AOT Cache: {AOT_FILE}")
+        cmd = list(build_server_cmd(memory, assets_path, use_aot))
 
         try:
             startupinfo = subprocess.STARTUPINFO() if IS_WINDOWS else None
             creationflags = subprocess.CREATE_NEW_PROCESS_GROUP if IS_WINDOWS else 0
             
-            self.server_process = subprocess.Popen(
-                cmd, env=env,
+            popen_kwargs = dict(
+                env=env,
                 stdout=subprocess.PIPE, stderr=subprocess.PIPE, stdin=subprocess.PIPE,
                 startupinfo=startupinfo, creationflags=creationflags
             )
+            # A bigger kernel pipe gives the JVM slack during log bursts before
+            # its writes block on us (Linux only, Python 3.10+)
+            if sys.platform.startswith("linux") and sys.version_info >= (3, 10):
+                try:
+                    self.server_process = subprocess.Popen(cmd, pipesize=SERVER_PIPE_SIZE, **popen_kwargs)
+                except PermissionError:
+                    # Over the per-user pipe quota; the default size still works
+                    self.server_process = subprocess.Popen(cmd, **popen_kwargs)
+            else:
+                self.server_process = subprocess.Popen(cmd, **popen_kwargs)
+            self.server_stopped.clear()
             self.start_time = datetime.datetime.now()
-            self.update_status({"state": "Running", "pid": self.server_process.pid})
+            self.update_status({"state": "Running", "pid": self.server_process.pid, "start_time": self.start_time})
 
-            threading.Thread(target=self._read_stream, args=(self.server_process.stdout, "stdout"), daemon=True).start()
-            threading.Thread(target=self._read_stream, args=(self.server_process.stderr, "stderr"), daemon=True).start()
+            if IS_WINDOWS:
+                # selectors can't wait on pipes on Windows, so use a thread per pipe there
+                threading.Thread(target=self._read_stream, args=(self.server_process.stdout, "stdout"), daemon=True).start()
+                threading.Thread(target=self._read_stream, args=(self.server_process.stderr, "stderr"), daemon=True).start()
+            else:
+                streams = {self.server_process.stdout: "stdout", self.server_process.stderr: "stderr"}
+                threading.Thread(target=self._read_streams, args=(streams,), daemon=True).start()
             
             self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self.monitor_thread.start()
@@ -810,43 +1720,81 @@ except Exception as e:
             self.log(f"Failed to start server: {e}")
             self.update_status({"state": "Stopped"})
 
-    def _read_stream(self, stream, tag):
+    def _log_lines(self, data, tag, final=False, prefix=""):
+        """Logs every complete line in data and returns the unfinished remainder."""
+        if final:
+            block, pending = data, b""
+        else:
+            # \r ends a line too, so progress bars redrawn in place still show up live
+            end = max(data.rfind(b"\n"), data.rfind(b"\r"))
+            if end < 0: return data
+            block, pending = data[:end], data[end + 1:]
+        if block:
+            # Only \r and \n end lines; splitlines() would also split on \x0b, \x0c, \x1c-\x1e,
+            # \x85 and \u2028/\u2029, which can appear in server output
+            text = block.decode('utf-8', errors='replace').replace("\r\n", "\n").replace("\r", "\n")
+            for line in text.split("\n"):
+                line = line.strip()
+                if line: self.log(prefix + line, tag)
+        return pending
+
+    def _read_stream(self, stream, tag, prefix=""):
         """Reads output from the server process stdout/stderr."""
+        # Pull whatever the pipe has in one read and split it ourselves, rather
+        # than paying a readline() call per line during log bursts
+        fd = stream.fileno()
+        pending = b""
         try:
-            for line_bytes in iter(stream.readline, b''):
-                if line_bytes:
-                    line = line_bytes.decode('utf-8', errors='replace').strip()
-                    if line: self.log(line, tag)
+            while True:
+                chunk = os.read(fd, STREAM_READ_SIZE)
+                if not chunk: break
+                pending = self._log_lines(pending + chunk, tag, prefix=prefix)
+            self._log_lines(pending, tag, final=True, prefix=prefix)
         except: pass
         finally: stream.close()
 
+    def _read_streams(self, streams):
+        """Reads several output pipes from one thread. streams maps stream -> tag."""
+        sel = selectors.DefaultSelector()
+        pending = {}
+        for stream, tag in streams.items():
+            sel.register(stream, selectors.EVENT_READ, tag)
+            pending[stream] = b""
+        try:
+            while sel.get_map():
+                for key, _ in sel.select():
+                    stream, tag = key.fileobj, key.data
+                    chunk = os.read(key.fd, STREAM_READ_SIZE)
+                    if chunk:
+                        pending[stream] = self._log_lines(pending[stream] + chunk, tag)
+                    else:
+                        # EOF: flush the last partial line and stop watching this pipe
+                        self._log_lines(pending.pop(stream), tag, final=True)
+                        sel.unregister(stream)
+                        stream.close()
+        except: pass
+        finally:
+            for stream in streams: stream.close()
+            sel.close()
+
     def _monitor_loop(self):
-        """Monitors the server process status."""
-        if not self.server_process: return
-        
-        while self.server_process and self.server_process.poll() is None:
-            if self.start_time:
-                uptime = datetime.datetime.now() - self.start_time
-                uptime_str = str(uptime).split('.')[0]
-                self.update_status({
-                    "state": "Running",
-                    "pid": self.server_process.pid,
-                    "uptime": uptime_str
-                })
-            
-            time.sleep(1)
+        """Waits for the server process to exit and handles the aftermath."""
+        proc = self.server_process
+        if not proc: return
 
-        rc = self.server_process.returncode
+        # Block until exit instead of polling; uptime is derived from start_time
+        # by whoever displays it
+        rc = proc.wait()
         self.log(f"Server exited with code {rc}")
         self.server_process = None
+        self.server_stopped.set()
         self.update_status({"state": "Stopped"})
         self.send_discord_webhook(f"🔴 Server Stopped (Code {rc})")
 
         if rc != 0 and not self.stop_requested and self.config.get("enable_auto_restart", True):
              self.log("Crash detected! Restarting in 10 seconds...")
              self.send_discord_webhook("⚠️ Crash detected. Restarting in 10s...")
-             time.sleep(10)
-             self.start_server_sequence()
+             self._schedule_start(10)
 
     def start_update_checker(self):
         """Starts the background update checker."""
@@ -899,16 +1847,37 @@ except Exception as e:
         """Restarts the server cleanly."""
         self.log("Restarting server...")
         self.stop_server()
-        
-        def delayed_start():
-            time.sleep(5) 
-            self.start_server_sequence()
-            
-        threading.Thread(target=delayed_start, daemon=True).start()
+        self._schedule_start(5)
+
+    def _schedule_start(self, delay):
+        """Starts the server after delay seconds; stop_server() cancels it."""
+        # A cancellable timer rather than a sleeping thread, so pressing Stop
+        # during a restart countdown really keeps the server down
+        if self.pending_start:
+            self.pending_start.cancel()
+        self.pending_start = threading.Timer(delay, self.start_server_sequence)
+        self.pending_start.daemon = True
+        self.pending_start.start()
+
+    def _start_cancelled(self):
+        """True if Stop (or closing the manager) happened while the start sequence was running."""
+        if not self.stop_requested: return False
+        self.log("Server start cancelled.")
+        self.update_status({"state": "Stopped"})
+        return True
+
+    def shutdown(self):
+        """Called when the manager exits: abandons any start in progress and queued background work."""
+        self.stop_requested = True
+        for timer in (self.pending_start, self.restart_timer, self.update_timer):
+            if timer: timer.cancel()
+        self.io_pool.shutdown(wait=False, cancel_futures=True)
 
     def stop_server(self):
         """Stops the running server process."""
         self.stop_requested = True
+        if self.pending_start:
+            self.pending_start.cancel()
         if self.restart_timer:
             self.restart_timer.cancel()
         if self.update_timer:
@@ -933,8 +1902,7 @@ except Exception as e:
             self.log("Executing scheduled restart...")
             self.send_discord_webhook("⏰ Executing scheduled restart...")
             self.stop_server()
-            time.sleep(10)
-            self.start_server_sequence()
+            self._schedule_start(10)
 
         self.restart_timer = threading.Timer(seconds, restart_task)
         self.restart_timer.start()
@@ -942,41 +1910,91 @@ except Exception as e:
 
 def run_console_mode():
     """Runs the updater in console-only mode."""
+    # The pipe readers only hand lines to the writer thread, never wait on the disk
+    log_writer = LogFileWriter(LOG_FILE)
+    atexit.register(log_writer.close)
+
     def console_logger(message, tag=None):
         # Core log handles rich output if available. 
         # This callback is primarily for file logging and fallback print.
-        timestamp = datetime.datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
+        timestamp = log_timestamp("[%Y-%m-%d %H:%M:%S]")
         
         # Only print if rich console is NOT active to avoid double printing
-        if not console:
+        if not rich_console():
              print(f"{timestamp} {message}")
         
-        with open(LOG_FILE, "a") as f:
-            f.write(f"{timestamp} {message}\n")
+        log_writer.write(f"{timestamp} {message}\n")
     
     config = load_config()
     core = HytaleUpdaterCore(console_logger, input_callback=input, config=config)
+    core.shutdown_hooks.append(log_writer.close)
     
     print("--- Console Mode ---")
     print("Use Ctrl+C to stop. The script will try to gracefully stop the server.")
     
     core.start_server_sequence()
     
+    # Nothing ever sets this; it just parks the main thread until Ctrl+C
+    idle = threading.Event()
     try:
-        while True:
-            time.sleep(1)
+        if IS_WINDOWS:
+            # Lock waits can't be interrupted by Ctrl+C on Windows, so wake up now and then
+            while not idle.wait(1): pass
+        else:
+            idle.wait()
     except KeyboardInterrupt:
         core.stop_server()
+        core.server_stopped.wait(timeout=30)
+        core.shutdown()
 
 def run_gui_mode():
     """Starts the graphical user interface."""
     import tkinter as tk
     from tkinter import scrolledtext, messagebox, ttk, filedialog
 
+    def build_theme(name, bg, fg, button_bg):
+        return {
+            "name": name,
+            "bg": bg,
+            "fg": fg,
+            "styles": (
+                (".", {"background": bg, "foreground": fg}),
+                ("TLabel", {"background": bg, "foreground": fg}),
+                ("TFrame", {"background": bg}),
+                ("TLabelFrame", {"background": bg, "foreground": fg}),
+                ("TButton", {"background": button_bg, "foreground": fg, "borderwidth": 1}),
+                ("TCheckbutton", {"background": bg, "foreground": fg}),
+            ),
+        }
+
     class HytaleGUI:
         """Tkinter-based GUI for the Hytale Server Manager."""
+        # Both palettes are resolved once; keyed by is_dark
+        THEMES = {
+            True: build_theme("hytale-dark", "#1e1e1e", "#d4d4d4", "#3c3c3c"),
+            False: build_theme("hytale-light", "#f0f0f0", "#000000", "#e0e0e0"),
+        }
+
+        # Console tag colors as (dark, light)
+        TAG_COLORS = {
+            "stderr": ("#ff5555", "#ff5555"),
+            "red": ("#ff5555", "#ff5555"),
+            "green": ("#55ff55", "#00aa00"),
+            "yellow": ("#ffff55", "#aaaa00"),
+            "cyan": ("#55ffff", "#00aaaa"),
+        }
+
         def __init__(self, root):
             self.root = root
+
+            # Each palette becomes its own ttk theme (derived from clam) once here,
+            # so toggling is a single theme_use instead of re-configuring every style
+            self.style = ttk.Style()
+            for theme in self.THEMES.values():
+                settings = {selector: {"configure": opts} for selector, opts in theme["styles"]}
+                settings["TButton"]["map"] = {"background": [("active", "#0078d7")], "foreground": [("active", "white")]}
+                settings["TEntry"] = {"configure": {"foreground": "black", "fieldbackground": "white"}}
+                self.style.theme_create(theme["name"], parent="clam", settings=settings)
             self.root.title(f"Hytale Server Manager v{version.__version__}")
             
             self.root.geometry("1000x800")
@@ -995,20 +2013,43 @@ def run_gui_mode():
             self.var_discord_url = tk.StringVar(value=self.config.get("discord_webhook", ""))
             self.var_discord_token = tk.StringVar(value=self.config.get("discord_token", ""))
             self.var_discord_channel = tk.StringVar(value=str(self.config.get("discord_channel_id", 0)))
-            self.var_schedule_time = tk.StringVar(value=str(self.config.get("restart_interval", 12)))
+            self.var_schedule_time = tk.DoubleVar(value=self.config.get("restart_interval", 12))
             self.var_memory = tk.StringVar(value=self.config.get("server_memory", "8G"))
-            self.var_max_backups = tk.StringVar(value=str(self.config.get("max_backups", 3)))
+            self.var_max_backups = tk.IntVar(value=self.config.get("max_backups", 3))
             
             self.var_memory.trace_add("write", self.on_config_change)
 
             self.status_var = tk.StringVar(value="Status: Stopped")
             self.uptime_var = tk.StringVar(value="Uptime: 00:00:00")
 
-            self.log_queue = queue.Queue()
+            # Bounded so a burst of server output can't outrun the Tk thread
+            # indefinitely; append/popleft are atomic, no lock needed
+            self.log_queue = collections.deque(maxlen=LOG_QUEUE_MAX)
+            # The log file is written ahead of log_queue, so lines the bounded
+            # display queue drops during a burst still reach the file
+            self.log_writer = None
+            self.log_writer_lock = threading.Lock()
+            self.lines_since_trim = 0
+            self.log_pump_armed = False
+            # While the window is minimized, lines are parked here instead of
+            # being drawn into a widget nobody can see (only the tail is kept)
+            self.console_visible = True
+            self.hidden_lines = collections.deque(maxlen=CONSOLE_KEEP_LINES)
+            self.save_after_id = None
+            self.server_start_time = None
+            self.uptime_after_id = None
+            atexit.register(self.close_log_file)
+            # A debounced save still pending at exit would otherwise be lost
+            atexit.register(self.flush_save)
             self.core = HytaleUpdaterCore(self.log_queue_wrapper, self.ask_file, self.config, self.update_stats)
+            self.core.shutdown_hooks += [self.flush_save, self.close_log_file]
 
             self.setup_ui()
             self.apply_theme()
+            self.root.bind("<<LogMsg>>", self.update_log_loop)
+            self.root.bind("<Map>", self.on_map)
+            self.root.bind("<Unmap>", self.on_unmap)
+            self.root.protocol("WM_DELETE_WINDOW", self.on_close)
             self.update_log_loop()
 
             if self.var_autostart.get():
@@ -1056,12 +2097,15 @@ def run_gui_mode():
             bkp_frame.pack(anchor="w")
             ttk.Checkbutton(bkp_frame, text="Backup World on Start", variable=self.var_backup, command=self.save).pack(side=tk.LEFT)
             ttk.Label(bkp_frame, text="Max:").pack(side=tk.LEFT, padx=(5,2))
-            ttk.Entry(bkp_frame, textvariable=self.var_max_backups, width=3).pack(side=tk.LEFT)
+            # Only digits (or an empty field mid-edit) can be typed into the numeric entries
+            vcmd_int = (self.root.register(lambda p: p == "" or p.isdigit()), "%P")
+            vcmd_float = (self.root.register(lambda p: re.fullmatch(r"\d*\.?\d*", p) is not None), "%P")
+            ttk.Entry(bkp_frame, textvariable=self.var_max_backups, width=3, validate="key", validatecommand=vcmd_int).pack(side=tk.LEFT)
 
             sch_frame = ttk.Frame(c_col2)
             sch_frame.pack(anchor="w", pady=2)
             ttk.Checkbutton(sch_frame, text="Schedule Restart (Hrs)", variable=self.var_schedule, command=self.save).pack(side=tk.LEFT)
-            ttk.Entry(sch_frame, textvariable=self.var_schedule_time, width=5).pack(side=tk.LEFT, padx=5)
+            ttk.Entry(sch_frame, textvariable=self.var_schedule_time, width=5, validate="key", validatecommand=vcmd_float).pack(side=tk.LEFT, padx=5)
 
             c_col3_center = ttk.Frame(options_row)
             c_col3_center.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10))
@@ -1088,8 +2132,16 @@ def run_gui_mode():
             def open_dir(path):
                 try:
                     p = os.path.abspath(path)
-                    if not os.path.exists(p): os.makedirs(p)
-                    os.startfile(p) if IS_WINDOWS else subprocess.run(["xdg-open", p])
+                    ensure_dir(p)
+                    if IS_WINDOWS:
+                        os.startfile(p)
+                    else:
+                        # Spawn and forget; waiting for xdg-open here would freeze the UI.
+                        # A daemon thread reaps the child so it doesn't linger as a zombie;
+                        # not the io_pool, as the opener may run until its window closes
+                        opener = folder_opener()
+                        pid = os.posix_spawnp(opener, [opener, p], os.environ)
+                        threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
                 except Exception as e:
                     messagebox.showerror("Error", f"Could not open directory: {e}")
 
@@ -1169,8 +2221,14 @@ def run_gui_mode():
         def stop_server(self):
             self.core.stop_server()
             self.btn_stop.config(state=tk.DISABLED)
+            self.flush_log_file()
 
         def save(self):
+            channel = self.var_discord_channel.get()
+            def number(var, default):
+                # An empty (or lone ".") entry while the user is typing can't be read as a number
+                try: return var.get()
+                except tk.TclError: return default
             self.config.update({
                 "enable_logging": self.var_logging.get(),
                 "check_updates": self.var_check_upd.get(),
@@ -1181,90 +2239,216 @@ def run_gui_mode():
                 "enable_schedule": self.var_schedule.get(),
                 "discord_webhook": self.var_discord_url.get(),
                 "discord_token": self.var_discord_token.get(),
-                "discord_channel_id": int(self.var_discord_channel.get()) if self.var_discord_channel.get().isdigit() else 0,
-                "restart_interval": self.var_schedule_time.get(),
+                "discord_channel_id": int(channel) if channel.isdigit() else 0,
+                "restart_interval": number(self.var_schedule_time, 12.0),
                 "server_memory": self.var_memory.get(),
-                "max_backups": int(self.var_max_backups.get()) if self.var_max_backups.get().isdigit() else 3,
+                "max_backups": number(self.var_max_backups, 3),
                 "manager_auto_update": self.var_mgr_update.get()
             })
             self.core.config = self.config
-            save_config(self.config)
+
+            # Typing in an entry calls this per keystroke; write to disk once things settle
+            if self.save_after_id:
+                self.root.after_cancel(self.save_after_id)
+            self.save_after_id = self.root.after(SAVE_DEBOUNCE_MS, self.save_in_background)
+
+        def save_in_background(self):
+            # The fsync can take a while on slow disks; keep it off the Tk thread.
+            # The live dict is saved (under _config_lock), not a snapshot taken now:
+            # an older snapshot could land after a core save and undo its values
+            self.save_after_id = None
+            self.core.io_pool.submit(save_config, self.config)
+
+        def flush_save(self):
+            # At exit the pool is already shut down, so save inline
+            if self.save_after_id:
+                self.save_after_id = None
+                save_config(self.config)
 
         def update_stats(self, status):
             state = status.get("state", "Unknown")
-            if state == "Stopped":
-                 self.root.after(0, lambda: self.btn_start.config(state=tk.NORMAL))
-                 self.root.after(0, lambda: self.btn_stop.config(state=tk.DISABLED))
-                 self.root.after(0, lambda: self.status_var.set("Status: Stopped"))
-                 self.root.after(0, lambda: self.uptime_var.set("Uptime: 00:00:00"))
-            elif state == "Running":
-                 uptime = status.get("uptime", "00:00:00")
-                 self.root.after(0, lambda: self.status_var.set("Status: Running"))
-                 self.root.after(0, lambda: self.uptime_var.set(f"Uptime: {uptime}"))
+            start_time = status.get("start_time")
+
+            # One Tk callback per status update, applying every widget change together
+            def apply():
+                if state == "Stopped":
+                     self.server_start_time = None
+                     if self.uptime_after_id:
+                         self.root.after_cancel(self.uptime_after_id)
+                         self.uptime_after_id = None
+                     self.btn_start.config(state=tk.NORMAL)
+                     self.btn_stop.config(state=tk.DISABLED)
+                     self.status_var.set("Status: Stopped")
+                     self.uptime_var.set("Uptime: 00:00:00")
+                elif state == "Running":
+                     self.status_var.set("Status: Running")
+                     self.server_start_time = start_time
+                     if start_time and not self.uptime_after_id:
+                         self.tick_uptime()
+            self.root.after(0, apply)
+
+        def tick_uptime(self):
+            # The uptime clock runs on the Tk side; the core only reports the start time
+            self.uptime_after_id = None
+            if self.server_start_time is None: return
+            uptime = datetime.datetime.now() - self.server_start_time
+            self.uptime_var.set(f"Uptime: {str(uptime).split('.')[0]}")
+            self.uptime_after_id = self.root.after(1000, self.tick_uptime)
 
         def log_queue_wrapper(self, msg, tag=None):
-            timestamp = datetime.datetime.now().strftime("[%H:%M:%S]")
-            self.log_queue.put((f"{timestamp} {msg}\n", tag))
-            if self.var_logging.get():
-                clean_msg = re.sub(r'\x1b\[[0-9;]*m', '', f"{timestamp} {msg}\n")
-                with open(LOG_FILE, "a", encoding="utf-8") as f: f.write(clean_msg)
-
-        def update_log_loop(self):
-            while not self.log_queue.empty():
-                msg, tag = self.log_queue.get()
-                self.console.config(state=tk.NORMAL)
-                self.insert_colored(msg, tag)
-                
-                # Prevent memory leaks by limiting the buffer size
-                num_lines = float(self.console.index('end-1c'))
-                if num_lines > 1000:
-                    self.console.delete('1.0', '50.0')
-                
-                self.console.see(tk.END)
-                self.console.config(state=tk.DISABLED)
-            self.root.after(100, self.update_log_loop)
+            timestamp = log_timestamp("[%H:%M:%S]")
+            line = f"{timestamp} {msg}\n"
+            if self.config.get("enable_logging", True):
+                self.write_log_file(line)
+            self.log_queue.append((line, tag))
+            # Wake the Tk thread only when the queue goes from drained to pending;
+            # everything queued before it runs is picked up in the same batch
+            if not self.log_pump_armed:
+                self.log_pump_armed = True
+                try:
+                    self.root.event_generate("<<LogMsg>>", when="tail")
+                except (tk.TclError, RuntimeError):
+                    # Main loop not running (yet, or any more); retry on the next message
+                    self.log_pump_armed = False
+
+        def write_log_file(self, line):
+            # Called from any thread; the writer is created on first use
+            if self.log_writer is None:
+                with self.log_writer_lock:
+                    if self.log_writer is None:
+                        self.log_writer = LogFileWriter(LOG_FILE)
+            self.log_writer.write(strip_ansi(line))
+
+        def drain_log_queue(self, limit=None):
+            batch = []
+            try:
+                while limit is None or len(batch) < limit:
+                    batch.append(self.log_queue.popleft())
+            except IndexError: pass
+            return batch
+
+        def flush_log_file(self):
+            if self.log_writer: self.log_writer.flush()
+
+        def close_log_file(self):
+            if self.log_writer: self.log_writer.close()
+
+        def on_close(self):
+            self.core.shutdown()
+            self.root.destroy()
+
+        def on_unmap(self, event):
+            # Toplevel bindings also fire for every child widget
+            if event.widget is self.root:
+                self.console_visible = False
+
+        def on_map(self, event):
+            if event.widget is not self.root or self.console_visible: return
+            self.console_visible = True
+            if self.hidden_lines:
+                batch = list(self.hidden_lines)
+                self.hidden_lines.clear()
+                self.render_log_batch(batch)
+
+        def update_log_loop(self, event=None):
+            # Drain everything queued since the last wake-up and redraw once.
+            # Disarm first so a message queued mid-drain raises a fresh event.
+            self.log_pump_armed = False
+            batch = self.drain_log_queue(LOG_BATCH_MAX)
+            if self.log_queue:
+                # Burst bigger than one batch: take the rest on the next turn of the
+                # event loop, so input and redraws get handled in between
+                self.log_pump_armed = True
+                self.root.after(0, self.update_log_loop)
+
+            if batch:
+                if self.console_visible:
+                    self.render_log_batch(batch)
+                else:
+                    self.hidden_lines.extend(batch)
+
+        def render_log_batch(self, batch):
+            self.console.config(state=tk.NORMAL)
+            # Bound once; this loop runs for every drained message
+            insert, END, insert_colored = self.console.insert, tk.END, self.insert_colored
+            # Consecutive plain lines with the same tag go in with a single insert
+            run, run_tag = [], None
+            for msg, tag in batch:
+                if '\x1b' in msg:
+                    if run: insert(END, "".join(run), (run_tag,) if run_tag else ())
+                    run = []
+                    insert_colored(msg, tag)
+                    continue
+                base_tag = tag if tag == "stderr" else None
+                if run and base_tag != run_tag:
+                    insert(END, "".join(run), (run_tag,) if run_tag else ())
+                    run = []
+                run_tag = base_tag
+                run.append(msg)
+            if run: insert(END, "".join(run), (run_tag,) if run_tag else ())
+
+            # Prevent memory leaks by limiting the buffer size. Let it overshoot
+            # a little and cut back in one go, so index/delete run rarely.
+            self.lines_since_trim += sum(msg.count("\n") for msg, _ in batch)
+            if self.lines_since_trim >= CONSOLE_TRIM_CHECK_LINES:
+                self.lines_since_trim = 0
+                num_lines = int(self.console.index('end-1c').split('.')[0])
+                if num_lines > CONSOLE_MAX_LINES:
+                    self.console.delete('1.0', f'{num_lines - CONSOLE_KEEP_LINES}.0')
+
+            self.console.see(tk.END)
+            self.console.config(state=tk.DISABLED)
 
         def insert_colored(self, text, tag):
-             parts = re.split(r'(\x1b\[[0-9;]*m)', text)
              current_tag = tag if tag == "stderr" else None
-             for part in parts:
-                 if part.startswith('\x1b['):
-                     code = part.strip()[2:-1]
-                     if code == "0": current_tag = None
-                     elif code in ["31","91"]: current_tag = "red"
-                     elif code in ["32","92"]: current_tag = "green"
-                     elif code in ["33","93"]: current_tag = "yellow"
-                     elif code in ["36","96"]: current_tag = "cyan"
-                 else:
-                     if part: self.console.insert(tk.END, part, (current_tag,) if current_tag else ())
+             # Fast path: most server lines carry no color codes at all
+             if '\x1b[' not in text:
+                 self.console.insert(tk.END, text, (current_tag,) if current_tag else ())
+                 return
+             # Walk the escapes in place and slice the text between them. Codes that
+             # don't change the color (bold, repeats, unknowns) don't split the text,
+             # so each color run is a single insert.
+             insert, END = self.console.insert, tk.END
+             run = []
+             pos = 0
+             for m in ANSI_STRIP_RE.finditer(text):
+                 start, end = m.span()
+                 if start > pos: run.append(text[pos:start])
+                 pos = end
+                 code = text[start + 2:end - 1]
+                 new_tag = None if code == "0" else ANSI_COLOR_TAGS.get(code, current_tag)
+                 if new_tag != current_tag:
+                     if run: insert(END, "".join(run), (current_tag,) if current_tag else ())
+                     run = []
+                     current_tag = new_tag
+                     self.ensure_tag(current_tag)
+             if pos < len(text): run.append(text[pos:])
+             if run: insert(END, "".join(run), (current_tag,) if current_tag else ())
 
         def ask_file(self, prompt):
             return filedialog.askopenfilename(title=prompt, filetypes=[("Zip Files", "*.zip")])
 
         def setup_tags(self):
-            self.console.tag_config("stderr", foreground="#ff5555")
-            self.console.tag_config("red", foreground="#ff5555")
-            self.console.tag_config("green", foreground="#55ff55" if self.is_dark else "#00aa00")
-            self.console.tag_config("yellow", foreground="#ffff55" if self.is_dark else "#aaaa00")
-            self.console.tag_config("cyan", foreground="#55ffff" if self.is_dark else "#00aaaa")
+            # Color tags are configured on first use; stderr shows up in almost every session
+            self.ready_tags = set()
+            self.ensure_tag("stderr")
+
+        def ensure_tag(self, tag):
+            if tag and tag not in self.ready_tags:
+                dark, light = self.TAG_COLORS[tag]
+                self.console.tag_config(tag, foreground=dark if self.is_dark else light)
+                self.ready_tags.add(tag)
 
         def apply_theme(self):
-            bg, fg = ("#1e1e1e", "#d4d4d4") if self.is_dark else ("#f0f0f0", "#000000")
-            txt_bg, txt_fg = bg, fg
+            theme = self.THEMES[self.is_dark]
+            self.style.theme_use(theme["name"])
+            # Recolor only the tags that have been used so far
+            for tag in self.ready_tags:
+                dark, light = self.TAG_COLORS[tag]
+                self.console.tag_config(tag, foreground=dark if self.is_dark else light)
             
-            style = ttk.Style()
-            style.theme_use('clam')
-            style.configure(".", background=bg, foreground=fg)
-            style.configure("TLabel", background=bg, foreground=fg)
-            style.configure("TFrame", background=bg)
-            style.configure("TLabelFrame", background=bg, foreground=fg)
-            style.configure("TButton", background="#3c3c3c" if self.is_dark else "#e0e0e0", foreground=fg, borderwidth=1)
-            style.map("TButton", background=[("active", "#0078d7")], foreground=[("active", "white")])
-            style.configure("TCheckbutton", background=bg, foreground=fg)
-            style.configure("TEntry", foreground="black", fieldbackground="white")
-            
-            self.root.configure(bg=bg)
-            self.console.config(bg=txt_bg, fg=txt_fg, insertbackground=fg)
+            self.root.configure(bg=theme["bg"])
+            self.console.config(bg=theme["bg"], fg=theme["fg"], insertbackground=theme["fg"])
 
         def toggle_theme(self):
             self.is_dark = not self.is_dark
@@ -1279,64 +2463,73 @@ def run_gui_mode():
 def print_help():
     """Prints the help message."""
     abs_config_path = os.path.abspath(CONFIG_FILE)
-    print(f"Hytale Server Manager v{version.__version__}")
-    print("=" * 60)
-    print("Usage: python hytale_server_manager.py [options]")
-    print("\nCommand Line Options:")
-    print("  -nogui       : Run in console-only mode (headless). Useful for servers.")
-    print("  -help, --help: Show this help message.")
-    print("\nDescription:")
-    print("  Manages the Hytale Dedicated Server life-cycle.")
-    print("  Features: Auto-Updates, Crash Detection, Auto-Restarts, World Backups, Discord Webhooks.")
-    
-    print("\nConfiguration File:")
-    print(f"  Location: {abs_config_path}")
-    print("\n  The configuration is a JSON file with the following options:")
-    print("  - last_server_version : Tracks the installed server version.")
-    print("  - dark_mode           : (GUI) Enable dark theme. [true/false]")
-    print("  - enable_logging      : Write logs to hytale_server_manager.log. [true/false]")
-    print("  - check_updates       : Check for updates on startup. [true/false]")
-    print("  - auto_start          : Automatically start the server when this script runs. [true/false]")
-    print("  - enable_backups      : Zip the world folder before starting. [true/false]")
-    print("  - max_backups         : Number of backups to keep. [Integer]")
-    print("  - enable_discord      : Enable Discord Webhook notifications. [true/false]")
-    print("  - discord_webhook     : The Discord Webhook URL. [String]")
-    print("  - enable_auto_restart : Restart server automatically on crash/stop. [true/false]")
-    print("  - enable_schedule     : Enable scheduled periodic restarts. [true/false]")
-    print("  - restart_interval    : Hours between scheduled restarts. [Float]")
-    print("  - server_memory       : Java Heap Size (e.g., '4G', '8G'). [String]")
-    print("=" * 60)
-    sys.exit(0)
+    lines = [
+        f"Hytale Server Manager v{version.__version__}",
+        "=" * 60,
+        "Usage: python hytale_server_manager.py [options]",
+        "\nCommand Line Options:",
+        "  -nogui       : Run in console-only mode (headless). Useful for servers.",
+        "  -help, --help: Show this help message.",
+        "\nDescription:",
+        "  Manages the Hytale Dedicated Server life-cycle.",
+        "  Features: Auto-Updates, Crash Detection, Auto-Restarts, World Backups, Discord Webhooks.",
+        "\nConfiguration File:",
+        f"  Location: {abs_config_path}",
+        "\n  The configuration is a JSON file with the following options:",
+        "  - last_server_version : Tracks the installed server version.",
+        "  - dark_mode           : (GUI) Enable dark theme. [true/false]",
+        "  - enable_logging      : Write logs to hytale_server_manager.log. [true/false]",
+        "  - check_updates       : Check for updates on startup. [true/false]",
+        "  - auto_start          : Automatically start the server when this script runs. [true/false]",
+        "  - enable_backups      : Zip the world folder before starting. [true/false]",
+        "  - max_backups         : Number of backups to keep. [Integer]",
+        "  - enable_discord      : Enable Discord Webhook notifications. [true/false]",
+        "  - discord_webhook     : The Discord Webhook URL. [String]",
+        "  - enable_auto_restart : Restart server automatically on crash/stop. [true/false]",
+        "  - enable_schedule     : Enable scheduled periodic restarts. [true/false]",
+        "  - restart_interval    : Hours between scheduled restarts. [Float]",
+        "  - server_memory       : Java Heap Size (e.g., '4G', '8G'). [String]",
+        "=" * 60,
+    ]
+    # One write instead of a print (and lock/flush) per line
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    # Nothing is running or registered yet, so skip interpreter teardown
+    os._exit(0)
+
+def exit_after_error(prompt):
+    """Keeps a crash visible for a user at a terminal, then exits with an error code."""
+    # Under systemd, Task Scheduler etc. nobody can press Enter; exit so the supervisor can restart us
+    if sys.stdin and sys.stdin.isatty():
+        try: input(prompt)
+        except EOFError: pass
+    sys.exit(1)
 
 def main():
     """Main entry point."""
-    # Cleanup temporary update files
-    if os.path.exists("updater_installer.py"):
-        try: os.remove("updater_installer.py")
-        except: pass
-        
-    for f in ["version.py.new", "hytale_server_manager.py.new"]:
-         if os.path.exists(f):
-             try: os.remove(f)
-             except: pass
+    # Cleanup temporary update files (unlink directly; a missing file is the common case)
+    for f in ("updater_installer.py", "version.py.new", "hytale_server_manager.py.new"):
+        try: os.remove(f)
+        except OSError: pass
 
-    if "-help" in sys.argv or "--help" in sys.argv:
+    flags = frozenset(sys.argv[1:])
+    if "-help" in flags or "--help" in flags:
         print_help()
 
-    if "-nogui" in sys.argv:
+    if "-nogui" in flags or not HAS_TK:
         run_console_mode()
-    else:
-        try:
-            run_gui_mode()
-        except ImportError:
-            run_console_mode()
-        except Exception:
-             traceback.print_exc()
-             input("GUI Start Failed! Press Enter to exit...")
+        return
+    try:
+        import tkinter
+    except ImportError:
+        # _tkinter exists but Tcl/Tk itself failed to load
+        run_console_mode()
+        return
+    run_gui_mode()
 
 if __name__ == "__main__":
     try:
         main()
     except Exception:
         traceback.print_exc()
-        input("Critical Crash! Press Enter to exit...")
+        exit_after_error("Critical Crash! Press Enter to exit...")